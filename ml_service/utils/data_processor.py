@@ -1,5 +1,51 @@
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 from typing import List, Dict, Tuple
+from numba import njit
+
+
+@njit(cache=True, fastmath=True)
+def _skew_kernel(data):
+    """Sample skewness over a float64 array"""
+    n = data.size
+    if n < 3:
+        return 0.0
+    mean = data.mean()
+    std = data.std()
+    if std == 0:
+        return 0.0
+    acc = 0.0
+    for i in range(n):
+        d = (data[i] - mean) / std
+        acc += d * d * d
+    return (n / ((n - 1) * (n - 2))) * acc
+
+
+@njit(cache=True, fastmath=True)
+def _kurt_kernel(data):
+    """Sample excess kurtosis over a float64 array"""
+    n = data.size
+    if n < 4:
+        return 0.0
+    mean = data.mean()
+    std = data.std()
+    if std == 0:
+        return 0.0
+    acc = 0.0
+    for i in range(n):
+        d = (data[i] - mean) / std
+        acc += d * d * d * d
+    return (n * (n + 1) / ((n - 1) * (n - 2) * (n - 3))) * acc - \
+           (3 * (n - 1) ** 2 / ((n - 2) * (n - 3)))
+
+
+# Compile the kernels at import time so the first request doesn't pay
+# the JIT cost
+_warmup = np.zeros(8, dtype=np.float64)
+_skew_kernel(_warmup)
+_kurt_kernel(_warmup)
+del _warmup
+
 
 class DataProcessor:
     """
@@ -71,16 +117,9 @@ class DataProcessor:
         
         lower_bound = q1 - threshold * iqr
         upper_bound = q3 + threshold * iqr
-        
-        outlier_indices = []
-        outlier_values = []
-        
-        for idx, val in enumerate(data):
-            if val < lower_bound or val > upper_bound:
-                outlier_indices.append(idx)
-                outlier_values.append(float(val))
-        
-        return outlier_indices, outlier_values
+
+        indices = np.flatnonzero((data < lower_bound) | (data > upper_bound))
+        return indices.tolist(), data[indices].astype(float).tolist()
     
     @staticmethod
     def detect_outliers_zscore(data: np.ndarray, threshold: float = 3.0) -> Tuple[List[int], List[float]]:
@@ -101,16 +140,9 @@ class DataProcessor:
             return [], []
         
         z_scores = np.abs((data - mean) / std)
-        
-        outlier_indices = []
-        outlier_values = []
-        
-        for idx, (z_score, val) in enumerate(zip(z_scores, data)):
-            if z_score > threshold:
-                outlier_indices.append(idx)
-                outlier_values.append(float(val))
-        
-        return outlier_indices, outlier_values
+
+        indices = np.flatnonzero(z_scores > threshold)
+        return indices.tolist(), data[indices].astype(float).tolist()
     
     @staticmethod
     def normalize_data(data: np.ndarray, method: str = 'minmax') -> np.ndarray:
@@ -175,30 +207,21 @@ class DataProcessor:
     
     @staticmethod
     def _rolling_window(data: np.ndarray, window_size: int, func) -> np.ndarray:
-        """Apply a function over a rolling window"""
-        result = []
-        for i in range(len(data) - window_size + 1):
-            window = data[i:i + window_size]
-            result.append(func(window))
-        return np.array(result)
+        """Apply a reduction over a rolling window
+
+        sliding_window_view exposes every window as a strided view of the
+        original array, so one reduction along axis 1 replaces the
+        per-window slice/copy/call loop.
+        """
+        windows = sliding_window_view(data, window_size)
+        return func(windows, axis=1)
     
     @staticmethod
     def _calculate_skewness(data: np.ndarray) -> float:
         """Calculate skewness of the data"""
-        mean = np.mean(data)
-        std = np.std(data)
-        if std == 0:
-            return 0.0
-        n = len(data)
-        return (n / ((n - 1) * (n - 2))) * np.sum(((data - mean) / std) ** 3)
-    
+        return _skew_kernel(np.ascontiguousarray(data, dtype=np.float64))
+
     @staticmethod
     def _calculate_kurtosis(data: np.ndarray) -> float:
         """Calculate kurtosis of the data"""
-        mean = np.mean(data)
-        std = np.std(data)
-        if std == 0:
-            return 0.0
-        n = len(data)
-        return (n * (n + 1) / ((n - 1) * (n - 2) * (n - 3))) * np.sum(((data - mean) / std) ** 4) - \
-               (3 * (n - 1) ** 2 / ((n - 2) * (n - 3)))
\ No newline at end of file
+        return _kurt_kernel(np.ascontiguousarray(data, dtype=np.float64))
\ No newline at end of file
@@ -8,18 +8,49 @@ Generates separate statistics for front and back sensors
 """
 
 import numpy as np
+import pandas as pd
 from datetime import datetime
-from collections import defaultdict
+from functools import lru_cache
+
+@lru_cache(maxsize=4096)
+def _parse_timestamp_cached(timestamp_str):
+    """Parse an ISO timestamp to naive UTC, memoizing repeated strings.
+
+    fromisoformat is several times faster than strptime, and the cache
+    means a timestamp seen in multiple loops is only parsed once.
+    """
+    return datetime.fromisoformat(
+        timestamp_str.replace('Z', '+00:00')
+    ).replace(tzinfo=None)
+
+
+def _percentile_sorted(sorted_values, percent):
+    """Linear-interpolated percentile over an already-sorted array"""
+    pos = (len(sorted_values) - 1) * percent / 100.0
+    lo = int(pos)
+    frac = pos - lo
+    if frac == 0:
+        return sorted_values[lo]
+    return sorted_values[lo] + frac * (sorted_values[lo + 1] - sorted_values[lo])
+
+
+def _safe_float(value):
+    """Convert a raw feed value to float, mapping failures to NaN"""
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return np.nan
+
 
 class DataReporter:
     """Generate reports and statistics from dual sensor data"""
-    
+
     @staticmethod
     def parse_timestamp(timestamp_str):
         """Parse ThingSpeak timestamp to datetime object"""
         try:
-            return datetime.strptime(timestamp_str, '%Y-%m-%dT%H:%M:%SZ')
-        except:
+            return _parse_timestamp_cached(timestamp_str)
+        except (ValueError, TypeError, AttributeError):
             return datetime.utcnow()
     
     @staticmethod
@@ -32,17 +63,16 @@ class DataReporter:
             field_name (str): 'field1' or 'field2'
         
         Returns:
-            list: Valid numeric values
+            np.ndarray: Valid numeric values
         """
-        values = []
-        for feed in feeds:
-            try:
-                value = float(feed.get(field_name, 0))
-                if value > 0:  # Ignore zero/null values
-                    values.append(value)
-            except (ValueError, TypeError):
-                continue
-        return values
+        raw = [feed.get(field_name) for feed in feeds]
+        values = np.fromiter(
+            (_safe_float(x) for x in raw),
+            dtype=np.float64,
+            count=len(raw)
+        )
+        # Ignore zero/null values
+        return values[np.isfinite(values) & (values > 0)]
     
     @staticmethod
     def calculate_sensor_statistics(values):
@@ -50,12 +80,12 @@ class DataReporter:
         Calculate comprehensive statistics for a sensor
         
         Args:
-            values (list): Sensor readings
-        
+            values (np.ndarray): Sensor readings
+
         Returns:
             dict: Statistical summary
         """
-        if not values:
+        if len(values) == 0:
             return {
                 'count': 0,
                 'mean': 0,
@@ -69,19 +99,24 @@ class DataReporter:
                 'q3': 0
             }
         
-        np_values = np.array(values)
-        
+        # One sort gives min/max/median/quartiles; one dot product gives
+        # mean and variance — instead of nine separate passes over the data
+        s = np.sort(np.asarray(values, dtype=np.float64))
+        n = len(s)
+        mean = s.mean()
+        variance = max(np.dot(s, s) / n - mean * mean, 0.0)
+
         return {
-            'count': len(values),
-            'mean': round(np.mean(np_values), 2),
-            'median': round(np.median(np_values), 2),
-            'min': round(np.min(np_values), 2),
-            'max': round(np.max(np_values), 2),
-            'std': round(np.std(np_values), 2),
-            'variance': round(np.var(np_values), 2),
-            'range': round(np.max(np_values) - np.min(np_values), 2),
-            'q1': round(np.percentile(np_values, 25), 2),
-            'q3': round(np.percentile(np_values, 75), 2)
+            'count': n,
+            'mean': round(mean, 2),
+            'median': round(_percentile_sorted(s, 50), 2),
+            'min': round(s[0], 2),
+            'max': round(s[-1], 2),
+            'std': round(np.sqrt(variance), 2),
+            'variance': round(variance, 2),
+            'range': round(s[-1] - s[0], 2),
+            'q1': round(_percentile_sorted(s, 25), 2),
+            'q3': round(_percentile_sorted(s, 75), 2)
         }
     
     @staticmethod
@@ -90,13 +125,13 @@ class DataReporter:
         Calculate comparative metrics between sensors
         
         Args:
-            front_values (list): Front sensor readings
-            back_values (list): Back sensor readings
-        
+            front_values (np.ndarray): Front sensor readings
+            back_values (np.ndarray): Back sensor readings
+
         Returns:
             dict: Cross-analysis metrics
         """
-        if not front_values or not back_values:
+        if len(front_values) == 0 or len(back_values) == 0:
             return {
                 'avg_difference': 0,
                 'correlation': 0,
@@ -107,19 +142,18 @@ class DataReporter:
         front_mean = np.mean(front_values)
         back_mean = np.mean(back_values)
         
-        # Calculate correlation if both have same length
+        # Calculate correlation if both have same length; two dot
+        # products give the single coefficient we need without
+        # corrcoef's full covariance matrix
         min_len = min(len(front_values), len(back_values))
         correlation = 0
         if min_len > 1:
-            try:
-                correlation = np.corrcoef(
-                    front_values[:min_len], 
-                    back_values[:min_len]
-                )[0, 1]
-                if np.isnan(correlation):
-                    correlation = 0
-            except:
-                correlation = 0
+            a = np.asarray(front_values[:min_len], dtype=np.float64)
+            b = np.asarray(back_values[:min_len], dtype=np.float64)
+            a = a - a.mean()
+            b = b - b.mean()
+            denom = np.sqrt(np.dot(a, a) * np.dot(b, b))
+            correlation = float(np.dot(a, b) / denom) if denom else 0
         
         # Data completeness (assuming readings should be equal)
         total_readings = max(len(front_values), len(back_values))
@@ -136,7 +170,52 @@ class DataReporter:
         }
     
     @staticmethod
-    def calculate_hourly_stats(feeds, field_name):
+    def _feed_frame(feeds):
+        """
+        Decode the feed dicts once into timestamp/field1/field2 columns
+
+        One pd.to_datetime and one pd.to_numeric per column replace the
+        repeated per-field scans the individual reporters would
+        otherwise do over the same list of dicts.
+        """
+        return pd.DataFrame({
+            't': pd.to_datetime(
+                [f.get('created_at') for f in feeds],
+                utc=True, errors='coerce', format='ISO8601'
+            ),
+            'field1': pd.to_numeric(
+                [f.get('field1') for f in feeds], errors='coerce'
+            ),
+            'field2': pd.to_numeric(
+                [f.get('field2') for f in feeds], errors='coerce'
+            )
+        })
+
+    @staticmethod
+    def _valid_values(column):
+        """Finite, positive readings from a coerced feed-frame column"""
+        values = column.to_numpy(dtype=np.float64)
+        return values[np.isfinite(values) & (values > 0)]
+
+    @staticmethod
+    def _sensor_frame(feeds, field_name, feed_frame=None):
+        """
+        Build a (timestamp, value) DataFrame of valid readings for one sensor
+
+        Rows with unparseable timestamps, invalid values, or zero/null
+        readings are dropped. Pass a prebuilt feed_frame to share one
+        decode across several reporters.
+        """
+        if feed_frame is None:
+            feed_frame = DataReporter._feed_frame(feeds)
+        df = pd.DataFrame({
+            't': feed_frame['t'],
+            'v': feed_frame[field_name]
+        }).dropna()
+        return df[df['v'] > 0]
+
+    @staticmethod
+    def calculate_hourly_stats(feeds, field_name, feed_frame=None):
         """
         Calculate hourly statistics for a specific sensor
         
@@ -147,34 +226,27 @@ class DataReporter:
         Returns:
             list: Hourly statistics
         """
-        hourly_data = defaultdict(list)
-        
-        for feed in feeds:
-            timestamp = DataReporter.parse_timestamp(feed.get('created_at', ''))
-            hour_key = timestamp.strftime('%Y-%m-%d %H:00')
-            
-            try:
-                value = float(feed.get(field_name, 0))
-                if value > 0:
-                    hourly_data[hour_key].append(value)
-            except (ValueError, TypeError):
-                continue
-        
-        hourly_stats = []
-        for hour, values in sorted(hourly_data.items()):
-            if values:
-                hourly_stats.append({
-                    'hour': hour,
-                    'avg': round(np.mean(values), 2),
-                    'min': round(np.min(values), 2),
-                    'max': round(np.max(values), 2),
-                    'count': len(values)
-                })
-        
-        return hourly_stats
+        df = DataReporter._sensor_frame(feeds, field_name, feed_frame)
+        if df.empty:
+            return []
+
+        grouped = df.groupby(df['t'].dt.floor('h'))['v'].agg(
+            ['mean', 'min', 'max', 'size']
+        )
+
+        return [
+            {
+                'hour': hour.strftime('%Y-%m-%d %H:00'),
+                'avg': round(mean, 2),
+                'min': round(low, 2),
+                'max': round(high, 2),
+                'count': int(count)
+            }
+            for hour, mean, low, high, count in grouped.itertuples()
+        ]
     
     @staticmethod
-    def calculate_daily_stats(feeds, field_name):
+    def calculate_daily_stats(feeds, field_name, feed_frame=None):
         """
         Calculate daily statistics for a specific sensor
         
@@ -185,32 +257,25 @@ class DataReporter:
         Returns:
             list: Daily statistics
         """
-        daily_data = defaultdict(list)
-        
-        for feed in feeds:
-            timestamp = DataReporter.parse_timestamp(feed.get('created_at', ''))
-            day_key = timestamp.strftime('%Y-%m-%d')
-            
-            try:
-                value = float(feed.get(field_name, 0))
-                if value > 0:
-                    daily_data[day_key].append(value)
-            except (ValueError, TypeError):
-                continue
-        
-        daily_stats = []
-        for day, values in sorted(daily_data.items()):
-            if values:
-                daily_stats.append({
-                    'day': day,
-                    'avg': round(np.mean(values), 2),
-                    'min': round(np.min(values), 2),
-                    'max': round(np.max(values), 2),
-                    'count': len(values),
-                    'std': round(np.std(values), 2)
-                })
-        
-        return daily_stats
+        df = DataReporter._sensor_frame(feeds, field_name, feed_frame)
+        if df.empty:
+            return []
+
+        by_day = df.groupby(df['t'].dt.floor('D'))['v']
+        grouped = by_day.agg(['mean', 'min', 'max', 'size'])
+        grouped['std'] = by_day.std(ddof=0)
+
+        return [
+            {
+                'day': day.strftime('%Y-%m-%d'),
+                'avg': round(mean, 2),
+                'min': round(low, 2),
+                'max': round(high, 2),
+                'count': int(count),
+                'std': round(std, 2)
+            }
+            for day, mean, low, high, count, std in grouped.itertuples()
+        ]
     
     @staticmethod
     def calculate_trend(values):
@@ -297,9 +362,12 @@ class DataReporter:
         Returns:
             dict: Complete report with separate sensor analysis
         """
+        # Decode the feeds once and share the columns across every reporter
+        feed_frame = DataReporter._feed_frame(feeds)
+
         # Extract values for both sensors
-        front_values = DataReporter.extract_sensor_values(feeds, 'field1')
-        back_values = DataReporter.extract_sensor_values(feeds, 'field2')
+        front_values = DataReporter._valid_values(feed_frame['field1'])
+        back_values = DataReporter._valid_values(feed_frame['field2'])
         
         # Calculate statistics for each sensor
         front_stats = DataReporter.calculate_sensor_statistics(front_values)
@@ -313,10 +381,10 @@ class DataReporter:
         back_trend = DataReporter.calculate_trend(back_values)
         
         # Hourly and daily stats for both sensors
-        front_hourly = DataReporter.calculate_hourly_stats(feeds, 'field1')
-        back_hourly = DataReporter.calculate_hourly_stats(feeds, 'field2')
-        front_daily = DataReporter.calculate_daily_stats(feeds, 'field1')
-        back_daily = DataReporter.calculate_daily_stats(feeds, 'field2')
+        front_hourly = DataReporter.calculate_hourly_stats(feeds, 'field1', feed_frame)
+        back_hourly = DataReporter.calculate_hourly_stats(feeds, 'field2', feed_frame)
+        front_daily = DataReporter.calculate_daily_stats(feeds, 'field1', feed_frame)
+        back_daily = DataReporter.calculate_daily_stats(feeds, 'field2', feed_frame)
         
         return {
             'channel_id': '3063140',
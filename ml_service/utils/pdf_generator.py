@@ -14,322 +14,906 @@ from reportlab.lib.units import inch
 from reportlab.lib import colors
 from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
 from reportlab.lib.enums import TA_CENTER, TA_LEFT
-from datetime import datetime
+from reportlab.pdfgen import canvas
+from fpdf import FPDF
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, date
+from functools import lru_cache
+import copy
 import io
+import os
+import pickle
+import queue
+
+# Pre-size the output buffer so reportlab's many small writes land in one
+# up-front allocation instead of repeated grow-and-copy resizes; a
+# generated report measures a few KB, so 16 KB covers it with headroom
+_INITIAL_BUFFER_SIZE = 16384
+
+# Small free-list of report buffers so bursty report traffic reuses the
+# same allocations instead of churning the allocator per call
+_BUFFER_POOL = queue.LifoQueue(maxsize=8)
+
+
+# Palette parsed once at import — HexColor re-parses the string and
+# allocates a fresh Color object on every call, and sharing the
+# instances also lets reportlab dedup color entries in the output
+_COL_DARK = colors.HexColor('#2c3e50')
+_COL_SLATE = colors.HexColor('#34495e')
+_COL_GRAY = colors.HexColor('#7f8c8d')
+_COL_LIGHT_GRAY = colors.HexColor('#95a5a6')
+_COL_BLUE = colors.HexColor('#3498db')
+_COL_BLUE_TINT = colors.HexColor('#d6eaf8')
+_COL_GREEN = colors.HexColor('#2ecc71')
+_COL_GREEN_TINT = colors.HexColor('#d5f4e6')
+_COL_PURPLE = colors.HexColor('#9b59b6')
+_COL_PURPLE_TINT = colors.HexColor('#e8daef')
+_COL_CLOUD = colors.HexColor('#ecf0f1')
+_COL_BORDER = colors.HexColor('#bdc3c7')
+
+# Styles are pure value objects that never change between reports, so
+# they are built once at import instead of on every generate call
+_STYLES = getSampleStyleSheet()
+
+_TITLE_STYLE = ParagraphStyle(
+    'CustomTitle',
+    parent=_STYLES['Heading1'],
+    fontSize=28,
+    textColor=_COL_DARK,
+    spaceAfter=20,
+    alignment=TA_CENTER,
+    fontName='Helvetica-Bold'
+)
+
+_HEADING_STYLE = ParagraphStyle(
+    'CustomHeading',
+    parent=_STYLES['Heading2'],
+    fontSize=18,
+    textColor=_COL_SLATE,
+    spaceAfter=15,
+    spaceBefore=20,
+    fontName='Helvetica-Bold'
+)
+
+_SUBHEADING_STYLE = ParagraphStyle(
+    'CustomSubHeading',
+    parent=_STYLES['Heading3'],
+    fontSize=14,
+    textColor=_COL_GRAY,
+    spaceAfter=10,
+    fontName='Helvetica-Bold'
+)
+
+_NORMAL_STYLE = ParagraphStyle(
+    'CustomNormal',
+    parent=_STYLES['Normal'],
+    fontSize=10,
+    textColor=_COL_DARK
+)
+
+# One centered variant of the normal style covers the subtitle, channel
+# info, and any future centered small text
+_NORMAL_CENTERED_STYLE = ParagraphStyle('normal_centered', parent=_NORMAL_STYLE, alignment=TA_CENTER)
+
+_FOOTER_STYLE = ParagraphStyle(
+    'Footer',
+    parent=_NORMAL_STYLE,
+    fontSize=8,
+    textColor=_COL_LIGHT_GRAY,
+    alignment=TA_CENTER
+)
+
+_OVERVIEW_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), _COL_SLATE),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 12),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('BACKGROUND', (0, 1), (-1, -1), _COL_CLOUD),
+    ('GRID', (0, 0), (-1, -1), 1, _COL_BORDER),
+    ('FONTSIZE', (0, 1), (-1, -1), 10),
+    ('PADDING', (0, 1), (-1, -1), 8),
+])
+
+_FRONT_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), _COL_BLUE),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 11),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
+    ('BACKGROUND', (0, 1), (-1, -1), _COL_BLUE_TINT),
+    ('GRID', (0, 0), (-1, -1), 1, _COL_BORDER),
+    ('FONTSIZE', (0, 1), (-1, -1), 10),
+    ('PADDING', (0, 1), (-1, -1), 8),
+])
+
+_BACK_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), _COL_GREEN),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 11),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
+    ('BACKGROUND', (0, 1), (-1, -1), _COL_GREEN_TINT),
+    ('GRID', (0, 0), (-1, -1), 1, _COL_BORDER),
+    ('FONTSIZE', (0, 1), (-1, -1), 10),
+    ('PADDING', (0, 1), (-1, -1), 8),
+])
+
+_COMPARISON_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), _COL_PURPLE),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 11),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
+    ('BACKGROUND', (0, 1), (-1, -1), _COL_PURPLE_TINT),
+    ('GRID', (0, 0), (-1, -1), 1, _COL_BORDER),
+    ('FONTSIZE', (0, 1), (-1, -1), 10),
+    ('PADDING', (0, 1), (-1, -1), 8),
+])
+
+_FRONT_DAILY_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), _COL_BLUE),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 9),
+    ('PADDING', (0, 0), (-1, -1), 6),
+    ('GRID', (0, 0), (-1, -1), 1, _COL_BORDER),
+])
+
+_BACK_DAILY_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), _COL_GREEN),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 9),
+    ('PADDING', (0, 0), (-1, -1), 6),
+    ('GRID', (0, 0), (-1, -1), 1, _COL_BORDER),
+])
+
+
+# Skip zlib compression of content streams: the report is a few KB of
+# table text, so deflate burns CPU on every build to save almost
+# nothing on the wire (and nothing at all once the HTTP layer gzips)
+_PAGE_COMPRESSION = 0
+
+# Page geometry never changes between reports
+_DOC_TEMPLATE_KWARGS = dict(
+    pagesize=letter,
+    rightMargin=72,
+    leftMargin=72,
+    topMargin=72,
+    bottomMargin=36,
+    pageCompression=_PAGE_COMPRESSION,
+)
+
+
+def _new_doc(buffer):
+    """Document template bound to an output buffer, fixed geometry"""
+    return SimpleDocTemplate(buffer, **_DOC_TEMPLATE_KWARGS)
+
+
+# Row templates for the Metric/Value tables: (label, key, default,
+# formatter), where the formatter is a callable, a format string, or
+# None for values used as-is
+_SENSOR_TABLE_ROWS = (
+    ('Sample Count', 'count', 0, str),
+    ('Mean', 'mean', 0, '{} cm'),
+    ('Median', 'median', 0, '{} cm'),
+    ('Std Deviation', 'std', 0, '{} cm'),
+    ('Min Value', 'min', 0, '{} cm'),
+    ('Max Value', 'max', 0, '{} cm'),
+    ('Range', 'range', 0, '{} cm'),
+    ('Q1 (25%)', 'q1', 0, '{} cm'),
+    ('Q3 (75%)', 'q3', 0, '{} cm'),
+)
+
+_COMPARISON_TABLE_ROWS = (
+    ('Average Difference', 'avg_difference', 0, '{} cm'),
+    ('Front/Back Ratio', 'front_back_ratio', 0, str),
+    ('Correlation', 'correlation', 0, str),
+    ('Data Completeness', 'data_completeness', '0%', None),
+    ('Front Sensor Readings', 'readings_front', 0, str),
+    ('Back Sensor Readings', 'readings_back', 0, str),
+)
+
+
+def _unpack(data, keys_defaults):
+    """Destructure a dict into values with defaults, in template order,
+    so sections can format from fast local variables instead of repeated
+    .get() method calls"""
+    return [data.get(key, default) for key, default in keys_defaults]
+
+
+def _stats_rows(data, template):
+    """Expand a row template against a stats dict"""
+    rows = [['Metric', 'Value']]
+    for label, key, default, fmt in template:
+        value = data.get(key, default)
+        if fmt is None:
+            rows.append([label, value])
+        elif callable(fmt):
+            rows.append([label, fmt(value)])
+        else:
+            rows.append([label, fmt.format(value)])
+    return rows
+
+
+def _build_stats_table(data, template, style):
+    """Build a styled two-column Metric/Value table from a template"""
+    table = Table(_stats_rows(data, template), colWidths=[3*inch, 3*inch])
+    table.setStyle(style)
+    return table
+
+
+def _maybe_trend_row(stats):
+    """Trend table row for a sensor, or None when no trend was computed"""
+    trend = stats.get('trend')
+    if not trend:
+        return None
+    trend_str = trend.get('trend', 'N/A').upper()
+    change = trend.get('change_percent', 0)
+    return ['Trend', f"{trend_str} ({change:+.1f}%)"]
+
+
+def _sensor_rows(stats):
+    """Row data for one sensor, with a trend row when one is available"""
+    rows = _stats_rows(stats, _SENSOR_TABLE_ROWS)
+    trend_row = _maybe_trend_row(stats)
+    if trend_row:
+        rows.append(trend_row)
+    return rows
+
+
+def _build_sensor_table(stats, style):
+    """Sensor statistics table, with a trend row when one is available"""
+    table = Table(_sensor_rows(stats), colWidths=[3*inch, 3*inch])
+    table.setStyle(style)
+    return table
+
+
+def _daily_rows(daily_stats):
+    """Recent-days row data from the last three daily buckets"""
+    return [['Date', 'Avg', 'Min', 'Max', 'Count']] + [
+        [
+            stat['day'],
+            f"{stat['avg']} cm",
+            f"{stat['min']} cm",
+            f"{stat['max']} cm",
+            str(stat['count'])
+        ]
+        for stat in daily_stats[-3:]
+    ]
+
+
+def _build_daily_table(daily_stats, style):
+    """Recent-days table from the last three daily buckets"""
+    table = Table(_daily_rows(daily_stats), colWidths=[1.8*inch, 1.1*inch, 1.1*inch, 1.1*inch, 0.9*inch])
+    table.setStyle(style)
+    return table
+
+
+# Fixed geometry for the direct-canvas renderer
+_FAST_MARGIN = 72
+_FAST_ROW_HEIGHT = 22
+
+
+def _canvas_table(canv, x, y, rows, col_widths, header_color, body_color):
+    """Draw a grid table with canvas primitives; returns the y below it.
+
+    Header band and body are two filled rects, the lattice is a single
+    canvas.grid() call, and cells are plain drawString — no flowable
+    wrap/split negotiation.
+    """
+    width = sum(col_widths)
+    height = _FAST_ROW_HEIGHT * len(rows)
+    xs = [x]
+    for col_width in col_widths:
+        xs.append(xs[-1] + col_width)
+    ys = [y - i * _FAST_ROW_HEIGHT for i in range(len(rows) + 1)]
+
+    canv.setFillColor(header_color)
+    canv.rect(x, y - _FAST_ROW_HEIGHT, width, _FAST_ROW_HEIGHT, stroke=0, fill=1)
+    canv.setFillColor(body_color)
+    canv.rect(x, y - height, width, height - _FAST_ROW_HEIGHT, stroke=0, fill=1)
+    canv.setStrokeColor(_COL_BORDER)
+    canv.grid(xs, ys)
+
+    for i, row in enumerate(rows):
+        if i == 0:
+            canv.setFont('Helvetica-Bold', 10)
+            canv.setFillColor(colors.whitesmoke)
+        elif i == 1:
+            canv.setFont('Helvetica', 10)
+            canv.setFillColor(_COL_DARK)
+        text_y = y - i * _FAST_ROW_HEIGHT - 15
+        for cell, cell_x in zip(row, xs):
+            canv.drawString(cell_x + 6, text_y, str(cell))
+
+    return y - height
+
+
+def _draw_report(canv, report_data):
+    """Draw the full daily report with direct canvas calls.
+
+    The report layout is fixed, so drawing each section at a tracked
+    cursor position skips the platypus layout engine entirely; content
+    matches the flowable path section for section.
+    """
+    page_width, page_height = letter
+    x = _FAST_MARGIN
+    y = page_height - _FAST_MARGIN
+
+    def ensure_space(needed):
+        nonlocal y
+        if y - needed < _FAST_MARGIN / 2:
+            canv.showPage()
+            y = page_height - _FAST_MARGIN
+
+    def heading(text):
+        nonlocal y
+        ensure_space(3 * _FAST_ROW_HEIGHT)
+        canv.setFont('Helvetica-Bold', 18)
+        canv.setFillColor(_COL_SLATE)
+        canv.drawString(x, y, text)
+        y -= 28
+
+    def subheading(text):
+        nonlocal y
+        ensure_space(2 * _FAST_ROW_HEIGHT)
+        canv.setFont('Helvetica-Bold', 14)
+        canv.setFillColor(_COL_GRAY)
+        canv.drawString(x, y, text)
+        y -= 20
+
+    def table(rows, col_widths, header_color, body_color):
+        nonlocal y
+        ensure_space(_FAST_ROW_HEIGHT * len(rows) + 10)
+        y = _canvas_table(canv, x, y, rows, col_widths, header_color, body_color)
+        y -= 26
+
+    # Title Section
+    canv.setFont('Helvetica-Bold', 28)
+    canv.setFillColor(_COL_DARK)
+    canv.drawCentredString(page_width / 2, y, "IoT Sensor Daily Report")
+    y -= 26
+
+    timestamp = datetime.now().strftime('%B %d, %Y at %I:%M %p')
+    canv.setFont('Helvetica-Oblique', 10)
+    canv.drawCentredString(page_width / 2, y, f"Generated on {timestamp}")
+    y -= 18
+
+    # Channel Info
+    channel_id = report_data.get('channel_id', '3063140')
+    canv.setFont('Helvetica', 10)
+    canv.drawCentredString(
+        page_width / 2, y,
+        f"Channel ID: {channel_id} | Platform: ThingSpeak Cloud"
+    )
+    y -= 44
+
+    # === METADATA SECTION ===
+    metadata = report_data.get('metadata', {})
+    entries_analyzed, time_span, last_updated = _unpack(metadata, (
+        ('entries_analyzed', 'N/A'),
+        ('time_span', 'N/A'),
+        ('last_updated', 'N/A'),
+    ))
+    heading("Report Overview")
+    table([
+        ['Metric', 'Value'],
+        ['Total Entries Analyzed', str(entries_analyzed)],
+        ['Time Period', time_span],
+        ['Report Generated', last_updated],
+    ], (3*inch, 3*inch), _COL_SLATE, _COL_CLOUD)
+
+    # === SENSOR SECTIONS ===
+    summary = report_data.get('summary', {})
+    front_stats, back_stats, cross = _unpack(summary, (
+        ('front_sensor', {}),
+        ('back_sensor', {}),
+        ('cross_analysis', {}),
+    ))
+
+    heading("Front Sensor (Field 1)")
+    table(_sensor_rows(front_stats), (3*inch, 3*inch), _COL_BLUE, _COL_BLUE_TINT)
+
+    heading("Back Sensor (Field 2)")
+    table(_sensor_rows(back_stats), (3*inch, 3*inch), _COL_GREEN, _COL_GREEN_TINT)
+
+    # === CROSS-ANALYSIS SECTION ===
+    heading("Comparative Analysis")
+    table(_stats_rows(cross, _COMPARISON_TABLE_ROWS), (3*inch, 3*inch),
+          _COL_PURPLE, _COL_PURPLE_TINT)
+
+    # === DAILY TRENDS ===
+    daily = report_data.get('daily', {})
+    front_daily, back_daily = _unpack(daily, (
+        ('front_sensor', []),
+        ('back_sensor', []),
+    ))
+
+    daily_widths = (1.8*inch, 1.1*inch, 1.1*inch, 1.1*inch, 0.9*inch)
+    if front_daily or back_daily:
+        heading("Daily Statistics Summary")
+        if front_daily:
+            subheading("Front Sensor - Recent Days:")
+            table(_daily_rows(front_daily), daily_widths, _COL_BLUE, colors.white)
+        if back_daily:
+            subheading("Back Sensor - Recent Days:")
+            table(_daily_rows(back_daily), daily_widths, _COL_GREEN, colors.white)
+
+    # === FOOTER ===
+    ensure_space(2 * _FAST_ROW_HEIGHT)
+    canv.setFont('Helvetica', 8)
+    canv.setFillColor(_COL_LIGHT_GRAY)
+    canv.drawCentredString(
+        page_width / 2, y,
+        "This report was automatically generated by the IoT Monitoring System"
+    )
+    y -= 11
+    canv.drawCentredString(
+        page_width / 2, y,
+        f"ThingSpeak Channel: {channel_id} | ML Model: K-Means Clustering Anomaly Detection"
+    )
+
+
+def _rgb255(color):
+    """reportlab Color -> 0-255 RGB tuple for fpdf's color setters"""
+    return (int(color.red * 255), int(color.green * 255), int(color.blue * 255))
+
+
+# fpdf works in 0-255 components rather than color objects
+_RGB_DARK = _rgb255(_COL_DARK)
+_RGB_SLATE = _rgb255(_COL_SLATE)
+_RGB_GRAY = _rgb255(_COL_GRAY)
+_RGB_LIGHT_GRAY = _rgb255(_COL_LIGHT_GRAY)
+_RGB_BLUE = _rgb255(_COL_BLUE)
+_RGB_BLUE_TINT = _rgb255(_COL_BLUE_TINT)
+_RGB_GREEN = _rgb255(_COL_GREEN)
+_RGB_GREEN_TINT = _rgb255(_COL_GREEN_TINT)
+_RGB_PURPLE = _rgb255(_COL_PURPLE)
+_RGB_PURPLE_TINT = _rgb255(_COL_PURPLE_TINT)
+_RGB_CLOUD = _rgb255(_COL_CLOUD)
+_RGB_BORDER = _rgb255(_COL_BORDER)
+
+
+def _fpdf_table(pdf, rows, col_widths, header_rgb, body_rgb):
+    """Emit a bordered, filled table with fpdf cell primitives"""
+    pdf.set_draw_color(*_RGB_BORDER)
+    for i, row in enumerate(rows):
+        if i == 0:
+            pdf.set_font('Helvetica', 'B', 10)
+            pdf.set_fill_color(*header_rgb)
+            pdf.set_text_color(255, 255, 255)
+        elif i == 1:
+            pdf.set_font('Helvetica', '', 10)
+            pdf.set_fill_color(*body_rgb)
+            pdf.set_text_color(*_RGB_DARK)
+        for cell, width in zip(row, col_widths):
+            pdf.cell(width, 8, str(cell), border=1, fill=True)
+        pdf.ln(8)
+
+
+def _fpdf_heading(pdf, text):
+    pdf.ln(4)
+    pdf.set_font('Helvetica', 'B', 16)
+    pdf.set_text_color(*_RGB_SLATE)
+    pdf.cell(0, 10, text)
+    pdf.ln(12)
+
+
+def _draw_report_fpdf(report_data):
+    """Build the daily report as an fpdf document.
+
+    fpdf skips reportlab's flowable layout engine entirely, so this is
+    the lightest rendering path; sections and palette mirror the
+    reportlab output (core fonts can't encode the heading emojis, so
+    those are dropped).
+    """
+    pdf = FPDF(format='letter')
+    pdf.set_auto_page_break(auto=True, margin=15)
+    pdf.add_page()
+
+    # Title Section
+    pdf.set_font('Helvetica', 'B', 28)
+    pdf.set_text_color(*_RGB_DARK)
+    pdf.cell(0, 14, "IoT Sensor Daily Report", align='C')
+    pdf.ln(16)
+
+    timestamp = datetime.now().strftime('%B %d, %Y at %I:%M %p')
+    pdf.set_font('Helvetica', 'I', 10)
+    pdf.cell(0, 6, f"Generated on {timestamp}", align='C')
+    pdf.ln(8)
+
+    # Channel Info
+    channel_id = report_data.get('channel_id', '3063140')
+    pdf.set_font('Helvetica', '', 10)
+    pdf.cell(0, 6, f"Channel ID: {channel_id} | Platform: ThingSpeak Cloud", align='C')
+    pdf.ln(14)
+
+    # === METADATA SECTION ===
+    metadata = report_data.get('metadata', {})
+    entries_analyzed, time_span, last_updated = _unpack(metadata, (
+        ('entries_analyzed', 'N/A'),
+        ('time_span', 'N/A'),
+        ('last_updated', 'N/A'),
+    ))
+    _fpdf_heading(pdf, "Report Overview")
+    _fpdf_table(pdf, [
+        ['Metric', 'Value'],
+        ['Total Entries Analyzed', str(entries_analyzed)],
+        ['Time Period', time_span],
+        ['Report Generated', last_updated],
+    ], (90, 90), _RGB_SLATE, _RGB_CLOUD)
+
+    # === SENSOR SECTIONS ===
+    summary = report_data.get('summary', {})
+    front_stats, back_stats, cross = _unpack(summary, (
+        ('front_sensor', {}),
+        ('back_sensor', {}),
+        ('cross_analysis', {}),
+    ))
+
+    _fpdf_heading(pdf, "Front Sensor (Field 1)")
+    _fpdf_table(pdf, _sensor_rows(front_stats), (90, 90), _RGB_BLUE, _RGB_BLUE_TINT)
+
+    _fpdf_heading(pdf, "Back Sensor (Field 2)")
+    _fpdf_table(pdf, _sensor_rows(back_stats), (90, 90), _RGB_GREEN, _RGB_GREEN_TINT)
+
+    # === CROSS-ANALYSIS SECTION ===
+    _fpdf_heading(pdf, "Comparative Analysis")
+    _fpdf_table(pdf, _stats_rows(cross, _COMPARISON_TABLE_ROWS), (90, 90),
+                _RGB_PURPLE, _RGB_PURPLE_TINT)
+
+    # === DAILY TRENDS ===
+    daily = report_data.get('daily', {})
+    front_daily, back_daily = _unpack(daily, (
+        ('front_sensor', []),
+        ('back_sensor', []),
+    ))
+
+    if front_daily or back_daily:
+        _fpdf_heading(pdf, "Daily Statistics Summary")
+        for label, daily_stats, header_rgb in (
+            ("Front Sensor - Recent Days:", front_daily, _RGB_BLUE),
+            ("Back Sensor - Recent Days:", back_daily, _RGB_GREEN),
+        ):
+            if daily_stats:
+                pdf.set_font('Helvetica', 'B', 12)
+                pdf.set_text_color(*_RGB_GRAY)
+                pdf.cell(0, 8, label)
+                pdf.ln(10)
+                _fpdf_table(pdf, _daily_rows(daily_stats),
+                            (54, 33, 33, 33, 27), header_rgb, (255, 255, 255))
+                pdf.ln(4)
+
+    # === FOOTER ===
+    pdf.ln(8)
+    pdf.set_font('Helvetica', '', 8)
+    pdf.set_text_color(*_RGB_LIGHT_GRAY)
+    pdf.cell(0, 4, "This report was automatically generated by the IoT Monitoring System",
+             align='C')
+    pdf.ln(5)
+    pdf.cell(0, 4, f"ThingSpeak Channel: {channel_id} | "
+                   "ML Model: K-Means Clustering Anomaly Detection", align='C')
+
+    return pdf
+
+
+# Invariant flowables, cached past the Paragraph constructor's inline
+# markup parse and style resolution. reportlab mutates Paragraph state
+# during layout, so consumers must append a copy.copy() of these, never
+# the cached instance itself.
+
+@lru_cache(maxsize=1)
+def _title_paragraph():
+    return Paragraph("IoT Sensor Daily Report", _TITLE_STYLE)
+
+
+@lru_cache(maxsize=64)
+def _channel_info_for(channel_id):
+    return Paragraph(
+        f"<b>Channel ID:</b> {channel_id} | <b>Platform:</b> ThingSpeak Cloud",
+        _NORMAL_CENTERED_STYLE
+    )
+
+
+@lru_cache(maxsize=64)
+def _footer_for(channel_id):
+    return Paragraph(
+        "This report was automatically generated by the IoT Monitoring System<br/>"
+        f"ThingSpeak Channel: {channel_id} | ML Model: K-Means Clustering Anomaly Detection",
+        _FOOTER_STYLE
+    )
+
+
+class _PooledBuffer(io.BytesIO):
+    """BytesIO that parks itself in the buffer pool on close.
+
+    send_file and with-blocks close the buffer once the PDF has been
+    sent; instead of freeing the allocation we rewind and keep it for
+    the next report. Stale bytes past the next report's length are
+    clipped by the end-of-build truncate. If the pool is full the buffer
+    closes normally.
+
+    close() is idempotent, like io.IOBase: a second close on an
+    already-parked buffer is a no-op, so send_file plus a with-block
+    can't park the same object twice and hand it out to two renders.
+    """
+
+    _parked = False
+
+    def close(self):
+        if self._parked or self.closed:
+            return
+        self._parked = True
+        try:
+            self.seek(0)
+            _BUFFER_POOL.put_nowait(self)
+        except queue.Full:
+            super().close()
+
+
+def _acquire_buffer():
+    """Pop a pooled report buffer, or create a pre-sized one"""
+    try:
+        buffer = _BUFFER_POOL.get_nowait()
+        buffer._parked = False
+        return buffer
+    except queue.Empty:
+        buffer = _PooledBuffer(bytes(_INITIAL_BUFFER_SIZE))
+        buffer.seek(0)
+        return buffer
+
+
+def _report_bytes(report_args):
+    """Render one (report_data, health_data) pair to PDF bytes.
+
+    Module-level so it pickles cleanly into process-pool workers, which
+    return bytes rather than BytesIO across the process boundary.
+    """
+    report_data, health_data = report_args
+    buffer = PDFReportGenerator._render_daily_report(report_data, health_data)
+    try:
+        return buffer.getvalue()
+    finally:
+        buffer.close()
+
+
+@lru_cache(maxsize=32)
+def _cached_report_pdf(inputs_blob, day_bucket):
+    """PDF bytes for one serialized (report_data, health_data) input.
+
+    Dashboards tend to download/email/preview the same report several
+    times; skipping the whole render beats any per-call optimization.
+    The day bucket in the key retires entries when the date rolls over,
+    and a refreshed report_data (new last_updated) misses naturally.
+    """
+    report_data, health_data = pickle.loads(inputs_blob)
+    buffer = PDFReportGenerator._render_daily_report(report_data, health_data)
+    try:
+        return buffer.getvalue()
+    finally:
+        buffer.close()
+
 
 class PDFReportGenerator:
     """Generate PDF reports for dual sensor data"""
-    
+
+    # Rendering backend: 'reportlab' (default) or 'fpdf'. fpdf is the
+    # lighter-weight library for this fixed-layout report; the switch
+    # routes every entry point, cache included.
+    backend = 'reportlab'
+
+    # Render with direct canvas drawing instead of platypus flowables;
+    # same sections and palette, minus the layout engine overhead
+    # (reportlab backend only)
+    use_fast_canvas = False
+
     @staticmethod
     def generate_daily_report(report_data, health_data=None):
         """
         Generate a comprehensive daily PDF report for dual sensors
-        
+
+        Renders at most once per distinct input per day; repeat calls
+        with the same report_data serve the memoized PDF bytes.
+
         Args:
             report_data (dict): Report data from DataReporter
             health_data (dict): Optional health data (can be None)
-        
+
         Returns:
             io.BytesIO: PDF file in memory
         """
-        buffer = io.BytesIO()
-        
-        doc = SimpleDocTemplate(
-            buffer,
-            pagesize=letter,
-            rightMargin=72,
-            leftMargin=72,
-            topMargin=72,
-            bottomMargin=36,
-        )
-        
+        try:
+            inputs_blob = pickle.dumps((report_data, health_data), protocol=5)
+        except Exception:
+            # Unpicklable input can't be keyed — render directly
+            return PDFReportGenerator._render_daily_report(report_data, health_data)
+
+        pdf = _cached_report_pdf(inputs_blob, date.today().toordinal())
+        buffer = _acquire_buffer()
+        buffer.write(pdf)
+        buffer.truncate(buffer.tell())
+        buffer.seek(0)
+        return buffer
+
+    @staticmethod
+    def generate_batch(reports, max_workers=None):
+        """
+        Render several reports in parallel across worker processes
+
+        ReportLab layout is CPU-bound pure-Python work that holds the
+        GIL, so batches (many channels, many days) scale with processes
+        rather than threads. Workers import this module and therefore
+        warm the cached styles once each.
+
+        Args:
+            reports (list): (report_data, health_data) tuples
+            max_workers (int): Optional worker cap (defaults to CPU count)
+
+        Returns:
+            list: PDF bytes for each report, in input order
+        """
+        if not reports:
+            return []
+        if len(reports) == 1:
+            return [_report_bytes(reports[0])]
+
+        workers = min(max_workers or os.cpu_count() or 1, len(reports))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(_report_bytes, reports))
+
+    @staticmethod
+    def generate_daily_report_to(stream, report_data, health_data=None):
+        """
+        Render the report straight into a caller-supplied file-like object
+
+        When the destination is an open file, HTTP response body, or
+        upload stream, this skips the intermediate in-memory buffer and
+        its full-report-size copy.
+
+        Args:
+            stream: Writable binary file-like object
+            report_data (dict): Report data from DataReporter
+            health_data (dict): Optional health data (can be None)
+        """
+        if PDFReportGenerator.backend == 'fpdf':
+            stream.write(bytes(_draw_report_fpdf(report_data).output()))
+            return
+        if PDFReportGenerator.use_fast_canvas:
+            canv = canvas.Canvas(stream, pagesize=letter,
+                                 pageCompression=_PAGE_COMPRESSION)
+            _draw_report(canv, report_data)
+            canv.save()
+            return
+        elements = PDFReportGenerator._build_elements(report_data, health_data)
+        _new_doc(stream).build(elements)
+
+    @staticmethod
+    def generate_daily_report_fpdf(report_data, health_data=None):
+        """
+        Generate the daily report with the fpdf backend directly
+
+        Args:
+            report_data (dict): Report data from DataReporter
+            health_data (dict): Optional health data (can be None)
+
+        Returns:
+            io.BytesIO: PDF file in memory
+        """
+        buffer = _acquire_buffer()
+        buffer.write(bytes(_draw_report_fpdf(report_data).output()))
+        buffer.truncate(buffer.tell())
+        buffer.seek(0)
+        return buffer
+
+    @staticmethod
+    def _render_daily_report(report_data, health_data=None):
+        """Render the report into a pooled in-memory buffer (uncached)"""
+        buffer = _acquire_buffer()
+        PDFReportGenerator.generate_daily_report_to(buffer, report_data, health_data)
+        buffer.truncate(buffer.tell())
+        buffer.seek(0)
+        return buffer
+
+    @staticmethod
+    def _build_elements(report_data, health_data=None):
+        """Assemble the report's flowable list"""
         elements = []
-        styles = getSampleStyleSheet()
-        
-        # Custom styles
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=28,
-            textColor=colors.HexColor('#2c3e50'),
-            spaceAfter=20,
-            alignment=TA_CENTER,
-            fontName='Helvetica-Bold'
-        )
-        
-        heading_style = ParagraphStyle(
-            'CustomHeading',
-            parent=styles['Heading2'],
-            fontSize=18,
-            textColor=colors.HexColor('#34495e'),
-            spaceAfter=15,
-            spaceBefore=20,
-            fontName='Helvetica-Bold'
-        )
-        
-        subheading_style = ParagraphStyle(
-            'CustomSubHeading',
-            parent=styles['Heading3'],
-            fontSize=14,
-            textColor=colors.HexColor('#7f8c8d'),
-            spaceAfter=10,
-            fontName='Helvetica-Bold'
-        )
-        
-        normal_style = ParagraphStyle(
-            'CustomNormal',
-            parent=styles['Normal'],
-            fontSize=10,
-            textColor=colors.HexColor('#2c3e50')
-        )
-        
-        # Title Section
-        title = Paragraph("IoT Sensor Daily Report", title_style)
-        elements.append(title)
-        
+
+        # Title Section + Channel Info
         timestamp = datetime.now().strftime('%B %d, %Y at %I:%M %p')
-        subtitle = Paragraph(
-            f"<i>Generated on {timestamp}</i>", 
-            ParagraphStyle('subtitle', parent=normal_style, alignment=TA_CENTER)
-        )
-        elements.append(subtitle)
-        elements.append(Spacer(1, 0.3*inch))
-        
-        # Channel Info
         channel_id = report_data.get('channel_id', '3063140')
-        channel_info = Paragraph(
-            f"<b>Channel ID:</b> {channel_id} | <b>Platform:</b> ThingSpeak Cloud", 
-            ParagraphStyle('channel', parent=normal_style, alignment=TA_CENTER)
-        )
-        elements.append(channel_info)
-        elements.append(Spacer(1, 0.4*inch))
-        
+        elements.extend([
+            copy.copy(_title_paragraph()),
+            Paragraph(f"<i>Generated on {timestamp}</i>", _NORMAL_CENTERED_STYLE),
+            Spacer(1, 0.3*inch),
+            copy.copy(_channel_info_for(channel_id)),
+            Spacer(1, 0.4*inch),
+        ])
+
         # === METADATA SECTION ===
         metadata = report_data.get('metadata', {})
-        elements.append(Paragraph("Report Overview", heading_style))
-        
+        entries_analyzed, time_span, last_updated = _unpack(metadata, (
+            ('entries_analyzed', 'N/A'),
+            ('time_span', 'N/A'),
+            ('last_updated', 'N/A'),
+        ))
         overview_data = [
             ['Metric', 'Value'],
-            ['Total Entries Analyzed', str(metadata.get('entries_analyzed', 'N/A'))],
-            ['Time Period', metadata.get('time_span', 'N/A')],
-            ['Report Generated', metadata.get('last_updated', 'N/A')]
+            ['Total Entries Analyzed', str(entries_analyzed)],
+            ['Time Period', time_span],
+            ['Report Generated', last_updated]
         ]
-        
         overview_table = Table(overview_data, colWidths=[3*inch, 3*inch])
-        overview_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#34495e')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 12),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#ecf0f1')),
-            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#bdc3c7')),
-            ('FONTSIZE', (0, 1), (-1, -1), 10),
-            ('PADDING', (0, 1), (-1, -1), 8),
-        ]))
-        
-        elements.append(overview_table)
-        elements.append(Spacer(1, 0.3*inch))
-        
-        # === FRONT SENSOR SECTION ===
+        overview_table.setStyle(_OVERVIEW_TABLE_STYLE)
+        elements.extend([
+            Paragraph("Report Overview", _HEADING_STYLE),
+            overview_table,
+            Spacer(1, 0.3*inch),
+        ])
+
+        # === SENSOR SECTIONS ===
         summary = report_data.get('summary', {})
-        front_stats = summary.get('front_sensor', {})
-        
-        elements.append(Paragraph("📍 Front Sensor (Field 1)", heading_style))
-        
-        front_data = [
-            ['Metric', 'Value'],
-            ['Sample Count', str(front_stats.get('count', 0))],
-            ['Mean', f"{front_stats.get('mean', 0)} cm"],
-            ['Median', f"{front_stats.get('median', 0)} cm"],
-            ['Std Deviation', f"{front_stats.get('std', 0)} cm"],
-            ['Min Value', f"{front_stats.get('min', 0)} cm"],
-            ['Max Value', f"{front_stats.get('max', 0)} cm"],
-            ['Range', f"{front_stats.get('range', 0)} cm"],
-            ['Q1 (25%)', f"{front_stats.get('q1', 0)} cm"],
-            ['Q3 (75%)', f"{front_stats.get('q3', 0)} cm"],
-        ]
-        
-        # Add trend if available
-        front_trend = front_stats.get('trend', {})
-        if front_trend:
-            trend_str = front_trend.get('trend', 'N/A').upper()
-            change = front_trend.get('change_percent', 0)
-            front_data.append(['Trend', f"{trend_str} ({change:+.1f}%)"])
-        
-        front_table = Table(front_data, colWidths=[3*inch, 3*inch])
-        front_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#3498db')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 11),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#d6eaf8')),
-            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#bdc3c7')),
-            ('FONTSIZE', (0, 1), (-1, -1), 10),
-            ('PADDING', (0, 1), (-1, -1), 8),
-        ]))
-        
-        elements.append(front_table)
-        elements.append(Spacer(1, 0.4*inch))
-        
-        # === BACK SENSOR SECTION ===
-        back_stats = summary.get('back_sensor', {})
-        
-        elements.append(Paragraph("📍 Back Sensor (Field 2)", heading_style))
-        
-        back_data = [
-            ['Metric', 'Value'],
-            ['Sample Count', str(back_stats.get('count', 0))],
-            ['Mean', f"{back_stats.get('mean', 0)} cm"],
-            ['Median', f"{back_stats.get('median', 0)} cm"],
-            ['Std Deviation', f"{back_stats.get('std', 0)} cm"],
-            ['Min Value', f"{back_stats.get('min', 0)} cm"],
-            ['Max Value', f"{back_stats.get('max', 0)} cm"],
-            ['Range', f"{back_stats.get('range', 0)} cm"],
-            ['Q1 (25%)', f"{back_stats.get('q1', 0)} cm"],
-            ['Q3 (75%)', f"{back_stats.get('q3', 0)} cm"],
-        ]
-        
-        # Add trend if available
-        back_trend = back_stats.get('trend', {})
-        if back_trend:
-            trend_str = back_trend.get('trend', 'N/A').upper()
-            change = back_trend.get('change_percent', 0)
-            back_data.append(['Trend', f"{trend_str} ({change:+.1f}%)"])
-        
-        back_table = Table(back_data, colWidths=[3*inch, 3*inch])
-        back_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2ecc71')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 11),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#d5f4e6')),
-            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#bdc3c7')),
-            ('FONTSIZE', (0, 1), (-1, -1), 10),
-            ('PADDING', (0, 1), (-1, -1), 8),
-        ]))
-        
-        elements.append(back_table)
-        elements.append(Spacer(1, 0.4*inch))
-        
+        front_stats, back_stats, cross = _unpack(summary, (
+            ('front_sensor', {}),
+            ('back_sensor', {}),
+            ('cross_analysis', {}),
+        ))
+        elements.extend([
+            Paragraph("📍 Front Sensor (Field 1)", _HEADING_STYLE),
+            _build_sensor_table(front_stats, _FRONT_TABLE_STYLE),
+            Spacer(1, 0.4*inch),
+            Paragraph("📍 Back Sensor (Field 2)", _HEADING_STYLE),
+            _build_sensor_table(back_stats, _BACK_TABLE_STYLE),
+            Spacer(1, 0.4*inch),
+        ])
+
         # === CROSS-ANALYSIS SECTION ===
-        cross = summary.get('cross_analysis', {})
-        
-        elements.append(Paragraph("🔄 Comparative Analysis", heading_style))
-        
-        comparison_data = [
-            ['Metric', 'Value'],
-            ['Average Difference', f"{cross.get('avg_difference', 0)} cm"],
-            ['Front/Back Ratio', str(cross.get('front_back_ratio', 0))],
-            ['Correlation', str(cross.get('correlation', 0))],
-            ['Data Completeness', cross.get('data_completeness', '0%')],
-            ['Front Sensor Readings', str(cross.get('readings_front', 0))],
-            ['Back Sensor Readings', str(cross.get('readings_back', 0))],
-        ]
-        
-        comparison_table = Table(comparison_data, colWidths=[3*inch, 3*inch])
-        comparison_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#9b59b6')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 11),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#e8daef')),
-            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#bdc3c7')),
-            ('FONTSIZE', (0, 1), (-1, -1), 10),
-            ('PADDING', (0, 1), (-1, -1), 8),
-        ]))
-        
-        elements.append(comparison_table)
-        elements.append(Spacer(1, 0.4*inch))
-        
+        elements.extend([
+            Paragraph("🔄 Comparative Analysis", _HEADING_STYLE),
+            _build_stats_table(cross, _COMPARISON_TABLE_ROWS, _COMPARISON_TABLE_STYLE),
+            Spacer(1, 0.4*inch),
+        ])
+
         # === DAILY TRENDS ===
         daily = report_data.get('daily', {})
-        front_daily = daily.get('front_sensor', [])
-        back_daily = daily.get('back_sensor', [])
-        
+        front_daily, back_daily = _unpack(daily, (
+            ('front_sensor', []),
+            ('back_sensor', []),
+        ))
+
         if front_daily or back_daily:
-            elements.append(Paragraph("📅 Daily Statistics Summary", heading_style))
-            
+            elements.append(Paragraph("📅 Daily Statistics Summary", _HEADING_STYLE))
+
             # Front sensor daily (last 3 days)
             if front_daily:
-                elements.append(Paragraph("Front Sensor - Recent Days:", subheading_style))
-                front_daily_data = [['Date', 'Avg', 'Min', 'Max', 'Count']]
-                for stat in front_daily[-3:]:
-                    front_daily_data.append([
-                        stat['day'],
-                        f"{stat['avg']} cm",
-                        f"{stat['min']} cm",
-                        f"{stat['max']} cm",
-                        str(stat['count'])
-                    ])
-                
-                front_daily_table = Table(front_daily_data, colWidths=[1.8*inch, 1.1*inch, 1.1*inch, 1.1*inch, 0.9*inch])
-                front_daily_table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#3498db')),
-                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),
-                    ('PADDING', (0, 0), (-1, -1), 6),
-                    ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#bdc3c7')),
-                ]))
-                elements.append(front_daily_table)
-                elements.append(Spacer(1, 0.2*inch))
-            
+                elements.extend([
+                    Paragraph("Front Sensor - Recent Days:", _SUBHEADING_STYLE),
+                    _build_daily_table(front_daily, _FRONT_DAILY_TABLE_STYLE),
+                    Spacer(1, 0.2*inch),
+                ])
+
             # Back sensor daily (last 3 days)
             if back_daily:
-                elements.append(Paragraph("Back Sensor - Recent Days:", subheading_style))
-                back_daily_data = [['Date', 'Avg', 'Min', 'Max', 'Count']]
-                for stat in back_daily[-3:]:
-                    back_daily_data.append([
-                        stat['day'],
-                        f"{stat['avg']} cm",
-                        f"{stat['min']} cm",
-                        f"{stat['max']} cm",
-                        str(stat['count'])
-                    ])
-                
-                back_daily_table = Table(back_daily_data, colWidths=[1.8*inch, 1.1*inch, 1.1*inch, 1.1*inch, 0.9*inch])
-                back_daily_table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2ecc71')),
-                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),
-                    ('PADDING', (0, 0), (-1, -1), 6),
-                    ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#bdc3c7')),
-                ]))
-                elements.append(back_daily_table)
-        
-        elements.append(Spacer(1, 0.5*inch))
-        
+                elements.extend([
+                    Paragraph("Back Sensor - Recent Days:", _SUBHEADING_STYLE),
+                    _build_daily_table(back_daily, _BACK_DAILY_TABLE_STYLE),
+                ])
+
         # === FOOTER ===
-        footer_style = ParagraphStyle(
-            'Footer',
-            parent=normal_style,
-            fontSize=8,
-            textColor=colors.HexColor('#95a5a6'),
-            alignment=TA_CENTER
-        )
-        
-        footer = Paragraph(
-            "This report was automatically generated by the IoT Monitoring System<br/>"
-            f"ThingSpeak Channel: {channel_id} | ML Model: K-Means Clustering Anomaly Detection",
-            footer_style
-        )
-        elements.append(footer)
-        
-        # Build PDF
-        doc.build(elements)
-        buffer.seek(0)
-        return buffer
+        elements.extend([
+            Spacer(1, 0.5*inch),
+            copy.copy(_footer_for(channel_id)),
+        ])
+
+        return elements
     
     @staticmethod
     def get_filename():